@@ -6,220 +6,249 @@ Corporate commitments and competitive landscape analysis
 
 import json
 import os
-from datetime import datetime, timedelta
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from functools import lru_cache
 import random
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json
+
+# Dedicated generator instance; skips the shared-instance lookup per draw
+_RNG = random.Random()
+
+# Static source tables; defined once at import so repeat calls don't rebuild them
+_DEMO_COMPANIES = [
+    {
+        "company": "Microsoft Corporation",
+        "commitment_type": "carbon-negative",
+        "target_year": 2030,
+        "commitment_details": "Microsoft reaffirms carbon negative commitment with new supply chain initiatives and tokenization pilots",
+        "carbon_volume_mentioned": "16 million tons CO2e annually",
+        "relevance_score": 0.85,
+        "dovu_opportunity": "Supply Chain Carbon Management - Full tokenization and tracking solution",
+        "source_url": "https://blogs.microsoft.com/blog/2020/01/16/microsoft-will-be-carbon-negative-by-2030/"
+    },
+    {
+        "company": "Amazon.com Inc",
+        "commitment_type": "net-zero",
+        "target_year": 2040,
+        "commitment_details": "Amazon expands Climate Pledge with new carbon accounting requirements for suppliers",
+        "carbon_volume_mentioned": "44 million tons CO2e baseline",
+        "relevance_score": 0.92,
+        "dovu_opportunity": "Comprehensive Decarbonization Platform - End-to-end carbon management",
+        "source_url": "https://sustainability.aboutamazon.com/climate-pledge"
+    },
+    {
+        "company": "Walmart Inc",
+        "commitment_type": "scope-reductions",
+        "target_year": 2030,
+        "commitment_details": "Walmart launches Project Gigaton expansion with blockchain-based carbon tracking for suppliers",
+        "carbon_volume_mentioned": "1 gigaton CO2e scope 3 reductions",
+        "relevance_score": 0.78,
+        "dovu_opportunity": "Supply Chain Carbon Management - Full tokenization and tracking solution",
+        "source_url": "https://corporate.walmart.com/newsroom/2020/09/21/walmart-sets-goal-to-become-a-regenerative-company"
+    },
+    {
+        "company": "Unilever PLC",
+        "commitment_type": "net-zero",
+        "target_year": 2039,
+        "commitment_details": "Unilever pilots digital carbon tokens for sustainable sourcing across value chain",
+        "carbon_volume_mentioned": "5.2 million tons CO2e scope 3",
+        "relevance_score": 0.65,
+        "dovu_opportunity": "Carbon Credit Procurement - Registry integration and verification",
+        "source_url": "https://www.unilever.com/news/news-search/2020/unilever-commits-to-net-zero-emissions-from-all-its-products-by-2039/"
+    },
+    {
+        "company": "IKEA Group",
+        "commitment_type": "carbon-negative",
+        "target_year": 2030,
+        "commitment_details": "IKEA announces partnership with carbon registry platforms for forestry offset tokenization",
+        "carbon_volume_mentioned": "2.8 million tons CO2e removals",
+        "relevance_score": 0.71,
+        "dovu_opportunity": "Comprehensive Decarbonization Platform - End-to-end carbon management",
+        "source_url": "https://www.ikea.com/us/en/this-is-ikea/newsroom/ikea-commits-to-become-climate-positive-by-2030-pub44f93660"
+    }
+]
+
+@lru_cache(maxsize=4)
+def _build_commitments(date_key):
+    """Build commitment records for a given day (memoized per date)"""
+    # Draw all day offsets in one batch; sample keeps the dates distinct
+    offsets = _RNG.sample(range(1, 31), k=len(_DEMO_COMPANIES))
+    # Format all announcement dates up front; strftime is slow per-call
+    date_strs = [(date_key - timedelta(days=d)).strftime('%Y-%m-%d') for d in offsets]
+    # Copy-and-merge the static record instead of rebuilding it key by key
+    return tuple({
+        **company_data,
+        "announcement_date": date_strs[i],
+        "baseline_year": None
+    } for i, company_data in enumerate(_DEMO_COMPANIES))
 
 def create_demo_commitments():
     """Load real corporate commitment data"""
-    
-    demo_companies = [
-        {
-            "company": "Microsoft Corporation",
-            "commitment_type": "carbon-negative",
-            "target_year": 2030,
-            "commitment_details": "Microsoft reaffirms carbon negative commitment with new supply chain initiatives and tokenization pilots",
-            "carbon_volume_mentioned": "16 million tons CO2e annually",
-            "relevance_score": 0.85,
-            "dovu_opportunity": "Supply Chain Carbon Management - Full tokenization and tracking solution",
-            "source_url": "https://blogs.microsoft.com/blog/2020/01/16/microsoft-will-be-carbon-negative-by-2030/"
-        },
-        {
-            "company": "Amazon.com Inc",
-            "commitment_type": "net-zero",
-            "target_year": 2040,
-            "commitment_details": "Amazon expands Climate Pledge with new carbon accounting requirements for suppliers",
-            "carbon_volume_mentioned": "44 million tons CO2e baseline",
-            "relevance_score": 0.92,
-            "dovu_opportunity": "Comprehensive Decarbonization Platform - End-to-end carbon management",
-            "source_url": "https://sustainability.aboutamazon.com/climate-pledge"
-        },
-        {
-            "company": "Walmart Inc",
-            "commitment_type": "scope-reductions",
-            "target_year": 2030,
-            "commitment_details": "Walmart launches Project Gigaton expansion with blockchain-based carbon tracking for suppliers",
-            "carbon_volume_mentioned": "1 gigaton CO2e scope 3 reductions",
-            "relevance_score": 0.78,
-            "dovu_opportunity": "Supply Chain Carbon Management - Full tokenization and tracking solution",
-            "source_url": "https://corporate.walmart.com/newsroom/2020/09/21/walmart-sets-goal-to-become-a-regenerative-company"
-        },
-        {
-            "company": "Unilever PLC",
-            "commitment_type": "net-zero",
-            "target_year": 2039,
-            "commitment_details": "Unilever pilots digital carbon tokens for sustainable sourcing across value chain",
-            "carbon_volume_mentioned": "5.2 million tons CO2e scope 3",
-            "relevance_score": 0.65,
-            "dovu_opportunity": "Carbon Credit Procurement - Registry integration and verification",
-            "source_url": "https://www.unilever.com/news/news-search/2020/unilever-commits-to-net-zero-emissions-from-all-its-products-by-2039/"
-        },
-        {
-            "company": "IKEA Group",
-            "commitment_type": "carbon-negative",
-            "target_year": 2030,
-            "commitment_details": "IKEA announces partnership with carbon registry platforms for forestry offset tokenization",
-            "carbon_volume_mentioned": "2.8 million tons CO2e removals",
-            "relevance_score": 0.71,
-            "dovu_opportunity": "Comprehensive Decarbonization Platform - End-to-end carbon management",
-            "source_url": "https://www.ikea.com/us/en/this-is-ikea/newsroom/ikea-commits-to-become-climate-positive-by-2030-pub44f93660"
-        }
-    ]
-    
-    commitments = []
-    for i, company_data in enumerate(demo_companies):
-        commitment_date = datetime.now() - timedelta(days=random.randint(1, 30))
-        
-        commitment = {
-            "company": company_data["company"],
-            "announcement_date": commitment_date.strftime('%Y-%m-%d'),
-            "commitment_type": company_data["commitment_type"],
-            "target_year": company_data["target_year"],
-            "baseline_year": None,
-            "commitment_details": company_data["commitment_details"],
-            "carbon_volume_mentioned": company_data["carbon_volume_mentioned"],
-            "source_url": company_data["source_url"],
-            "relevance_score": company_data["relevance_score"],
-            "dovu_opportunity": company_data["dovu_opportunity"]
-        }
-        commitments.append(commitment)
-    
-    return commitments
+    return list(_build_commitments(date.today()))
+
+# Established companies as competitive benchmarks without claiming recent funding
+_DEMO_FUNDING = [
+    {
+        "company": "Persefoni",
+        "funding_type": "Established Player",
+        "amount": "$101M+ Raised",
+        "valuation": "$1B",
+        "investors": ["Lightspeed Venture Partners", "TPG Rise Fund", "Energy Impact Partners"],
+        "sector": "carbon-management",
+        "business_model": "software-platform",
+        "stage": "mature",
+        "dovu_relevance": 0.92,
+        "competitive_threat": 0.95,
+        "partnership_opportunity": 0.35,
+        "source_url": "https://www.persefoni.com/"
+    },
+    {
+        "company": "Pachama",
+        "funding_type": "Market Leader",
+        "amount": "$55M+ Raised",
+        "valuation": "Private",
+        "investors": ["Lowercarbon Capital", "Future Positive Capital", "Breakthrough Energy Ventures"],
+        "sector": "nature-based-solutions",
+        "business_model": "software-platform",
+        "stage": "growth",
+        "dovu_relevance": 0.75,
+        "competitive_threat": 0.60,
+        "partnership_opportunity": 0.85,
+        "source_url": "https://pachama.com/"
+    },
+    {
+        "company": "Sylvera",
+        "funding_type": "Competitive Player",
+        "amount": "$30M+ Raised",
+        "valuation": "Private",
+        "investors": ["Index Ventures", "Insight Partners", "LocalGlobe"],
+        "sector": "carbon-management",
+        "business_model": "software-platform",
+        "stage": "growth",
+        "dovu_relevance": 0.88,
+        "competitive_threat": 0.80,
+        "partnership_opportunity": 0.70,
+        "source_url": "https://www.sylvera.com/"
+    },
+    {
+        "company": "Plan A",
+        "funding_type": "European Leader",
+        "amount": "$20M+ Raised",
+        "valuation": "Private",
+        "investors": ["Softbank Vision Fund 2", "Element Ventures", "Climate Capital"],
+        "sector": "carbon-management",
+        "business_model": "software-platform",
+        "stage": "growth",
+        "dovu_relevance": 0.85,
+        "competitive_threat": 0.75,
+        "partnership_opportunity": 0.60,
+        "source_url": "https://plana.earth/"
+    },
+    {
+        "company": "Sustainalytics",
+        "funding_type": "Enterprise Focus",
+        "amount": "Acquired by Morningstar",
+        "valuation": "Public (MORN)",
+        "investors": ["Morningstar Inc", "Public Markets"],
+        "sector": "carbon-management",
+        "business_model": "software-platform", 
+        "stage": "mature",
+        "dovu_relevance": 0.70,
+        "competitive_threat": 0.65,
+        "partnership_opportunity": 0.45,
+        "source_url": "https://www.sustainalytics.com/"
+    }
+]
+
+@lru_cache(maxsize=4)
+def _build_landscape(date_key):
+    """Build competitive landscape records for a given day (memoized per date)"""
+    # Recent market analysis dates (last 6 months)
+    offsets = _RNG.sample(range(30, 181), k=len(_DEMO_FUNDING))
+    date_strs = [(date_key - timedelta(days=d)).strftime('%Y-%m-%d') for d in offsets]
+    # Copy-and-merge the static record instead of rebuilding it key by key
+    return tuple({
+        **event_data,
+        "announcement_date": date_strs[i]
+    } for i, event_data in enumerate(_DEMO_FUNDING))
 
 def create_competitive_landscape():
     """Current climate tech competitive landscape - established companies"""
-    
-    # Use established companies as competitive benchmarks without claiming recent funding
-    demo_funding = [
-        {
-            "company": "Persefoni",
-            "funding_type": "Established Player",
-            "amount": "$101M+ Raised",
-            "valuation": "$1B",
-            "investors": ["Lightspeed Venture Partners", "TPG Rise Fund", "Energy Impact Partners"],
-            "sector": "carbon-management",
-            "business_model": "software-platform",
-            "stage": "mature",
-            "dovu_relevance": 0.92,
-            "competitive_threat": 0.95,
-            "partnership_opportunity": 0.35,
-            "source_url": "https://www.persefoni.com/"
-        },
-        {
-            "company": "Pachama",
-            "funding_type": "Market Leader",
-            "amount": "$55M+ Raised",
-            "valuation": "Private",
-            "investors": ["Lowercarbon Capital", "Future Positive Capital", "Breakthrough Energy Ventures"],
-            "sector": "nature-based-solutions",
-            "business_model": "software-platform",
-            "stage": "growth",
-            "dovu_relevance": 0.75,
-            "competitive_threat": 0.60,
-            "partnership_opportunity": 0.85,
-            "source_url": "https://pachama.com/"
-        },
-        {
-            "company": "Sylvera",
-            "funding_type": "Competitive Player",
-            "amount": "$30M+ Raised",
-            "valuation": "Private",
-            "investors": ["Index Ventures", "Insight Partners", "LocalGlobe"],
-            "sector": "carbon-management",
-            "business_model": "software-platform",
-            "stage": "growth",
-            "dovu_relevance": 0.88,
-            "competitive_threat": 0.80,
-            "partnership_opportunity": 0.70,
-            "source_url": "https://www.sylvera.com/"
-        },
-        {
-            "company": "Plan A",
-            "funding_type": "European Leader",
-            "amount": "$20M+ Raised",
-            "valuation": "Private",
-            "investors": ["Softbank Vision Fund 2", "Element Ventures", "Climate Capital"],
-            "sector": "carbon-management",
-            "business_model": "software-platform",
-            "stage": "growth",
-            "dovu_relevance": 0.85,
-            "competitive_threat": 0.75,
-            "partnership_opportunity": 0.60,
-            "source_url": "https://plana.earth/"
-        },
-        {
-            "company": "Sustainalytics",
-            "funding_type": "Enterprise Focus",
-            "amount": "Acquired by Morningstar",
-            "valuation": "Public (MORN)",
-            "investors": ["Morningstar Inc", "Public Markets"],
-            "sector": "carbon-management",
-            "business_model": "software-platform", 
-            "stage": "mature",
-            "dovu_relevance": 0.70,
-            "competitive_threat": 0.65,
-            "partnership_opportunity": 0.45,
-            "source_url": "https://www.sustainalytics.com/"
-        }
-    ]
-    
-    events = []
-    # Use recent dates for current competitive landscape analysis
-    for i, event_data in enumerate(demo_funding):
-        # Recent market analysis dates (last 6 months)
-        event_date = datetime.now() - timedelta(days=random.randint(30, 180))
-        
-        event = {
-            "company": event_data["company"],
-            "funding_type": event_data["funding_type"],
-            "amount": event_data["amount"],
-            "valuation": event_data.get("valuation"),
-            "investors": event_data["investors"],
-            "announcement_date": event_date.strftime('%Y-%m-%d'),
-            "sector": event_data["sector"],
-            "business_model": event_data["business_model"],
-            "stage": event_data["stage"],
-            "source_url": event_data.get("source_url", ""),
-            "dovu_relevance": event_data["dovu_relevance"],
-            "competitive_threat": event_data["competitive_threat"],
-            "partnership_opportunity": event_data["partnership_opportunity"]
-        }
-        events.append(event)
-    
-    return events
+    return list(_build_landscape(date.today()))
+
+# Columnar views of the static score fields, extracted once at import;
+# aggregations scan plain float tuples instead of per-record dicts
+_RELEVANCE_SCORES = tuple(c["relevance_score"] for c in _DEMO_COMPANIES)
+_THREAT_SCORES = tuple(f["competitive_threat"] for f in _DEMO_FUNDING)
+_PARTNERSHIP_SCORES = tuple(f["partnership_opportunity"] for f in _DEMO_FUNDING)
+
+def _highlight_counts():
+    """Count summary highlights from the columnar score views"""
+    high_relevance = sum(1 for s in _RELEVANCE_SCORES if s > 0.7)
+    threats = sum(1 for s in _THREAT_SCORES if s > 0.7)
+    opps = sum(1 for s in _PARTNERSHIP_SCORES if s > 0.7)
+    return high_relevance, threats, opps
 
 def main():
-    # Create data directory
-    os.makedirs('data', exist_ok=True)
+    # Create data directory (fast-path check; makedirs stats regardless)
+    if not os.path.isdir('data'):
+        os.makedirs('data')
     
     # Generate real market data
     commitments = create_demo_commitments()
     funding_events = create_competitive_landscape()
     
-    # Save to files
-    today = datetime.now().strftime('%Y%m%d')
-    
-    with open(f'data/commitments_{today}.json', 'w') as f:
-        json.dump(commitments, f, indent=2)
+    # Save to files; time.strftime goes straight to the C formatter
+    today = time.strftime('%Y%m%d')
     
-    with open(f'data/funding_{today}.json', 'w') as f:
-        json.dump(funding_events, f, indent=2)
-    
-    print(f"✅ Carbon market intelligence updated:")
-    print(f"   • {len(commitments)} corporate carbon commitments")
-    print(f"   • {len(funding_events)} competitive landscape companies")
-    print(f"   • Saved to data/commitments_{today}.json and data/funding_{today}.json")
-    print()
-    print("📊 Market intelligence summary:")
-    
-    high_relevance_commitments = [c for c in commitments if c['relevance_score'] > 0.7]
-    competitive_threats = [f for f in funding_events if f['competitive_threat'] > 0.7]
-    partnership_opps = [f for f in funding_events if f['partnership_opportunity'] > 0.7]
+    # The dashboard reads these files programmatically, so skip the
+    # pretty-printing cost unless a human asked to eyeball them
+    pretty = '--pretty' in sys.argv
+
+    def _write(path, obj):
+        if orjson:
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(obj, option=option))
+        else:
+            # Encode once, then write once: json.dump issues many small writes
+            with open(path, 'w') as f:
+                f.write(json.dumps(obj, indent=2 if pretty else None))
+
+    # The two payloads are independent, so overlap their disk writes;
+    # collecting the results re-raises any write failure before the
+    # success banner below can print
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(_write, f'data/commitments_{today}.json', commitments),
+            executor.submit(_write, f'data/funding_{today}.json', funding_events),
+        ]
+        for future in futures:
+            future.result()
     
-    print(f"   • {len(high_relevance_commitments)} high-relevance corporate targets")
-    print(f"   • {len(competitive_threats)} major competitive threats")
-    print(f"   • {len(partnership_opps)} partnership opportunities")
-    print()
-    print("🏢 All companies are real with working homepage links")
+    high_relevance, threats, opps = _highlight_counts()
+
+    # One joined print instead of ~12 separate stdout flushes
+    print('\n'.join([
+        "✅ Carbon market intelligence updated:",
+        f"   • {len(commitments)} corporate carbon commitments",
+        f"   • {len(funding_events)} competitive landscape companies",
+        f"   • Saved to data/commitments_{today}.json and data/funding_{today}.json",
+        "",
+        "📊 Market intelligence summary:",
+        f"   • {high_relevance} high-relevance corporate targets",
+        f"   • {threats} major competitive threats",
+        f"   • {opps} partnership opportunities",
+        "",
+        "🏢 All companies are real with working homepage links"
+    ]))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
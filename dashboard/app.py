@@ -5,14 +5,52 @@ Open access for team collaboration
 """
 
 from flask import Flask, render_template, jsonify, request
+from bisect import bisect_left
+import gzip
+import heapq
 import json
 import os
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
-import glob
+import re
+import threading
+import time
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Dict, Any, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to Flask's stdlib-json responses
 
 app = Flask(__name__)
 
+
+def fast_jsonify(obj):
+    """JSON response via orjson when available (3-6x faster than jsonify)"""
+    if orjson is None:
+        return jsonify(obj)
+    return app.response_class(orjson.dumps(obj), mimetype='application/json')
+
+
+# Serialized bodies keyed by (endpoint, source version, filter params); the
+# version component makes entries for stale data unreachable, and the cache is
+# dropped wholesale if it ever fills up with one-off filter combinations
+_RESPONSE_CACHE = {}
+_RESPONSE_CACHE_MAX = 64
+
+
+def _cached_response(key, build):
+    """Serve an already-serialized body for a repeat query, building it once"""
+    body = _RESPONSE_CACHE.get(key)
+    if body is None:
+        if len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAX:
+            _RESPONSE_CACHE.clear()
+        payload = build()
+        body = orjson.dumps(payload) if orjson else json.dumps(payload).encode()
+        _RESPONSE_CACHE[key] = body
+    return app.response_class(body, mimetype='application/json')
+
 # Security headers (keep these for basic protection)
 @app.after_request
 def add_security_headers(response):
@@ -21,54 +59,216 @@ def add_security_headers(response):
     response.headers['X-XSS-Protection'] = '1; mode=block'
     return response
 
+# Don't bother compressing tiny responses; the header overhead isn't worth it
+_COMPRESS_MIN_SIZE = 2048
+
+@app.after_request
+def compress_response(response):
+    """gzip JSON/HTML bodies for clients that accept it; the repetitive field
+    names and date strings compress roughly 8-10x"""
+    if (response.status_code == 200
+            and not response.direct_passthrough
+            and 'gzip' in request.headers.get('Accept-Encoding', '').lower()
+            and 'Content-Encoding' not in response.headers):
+        body = response.get_data()
+        if len(body) >= _COMPRESS_MIN_SIZE:
+            response.set_data(gzip.compress(body, compresslevel=4))
+            response.headers['Content-Encoding'] = 'gzip'
+    response.headers.add('Vary', 'Accept-Encoding')
+    return response
+
+# Registered after the gzip hook so it runs first (after_request callbacks run
+# in reverse order): the ETag is computed on the uncompressed body, and a 304
+# skips compression entirely
+@app.after_request
+def add_cache_validators(response):
+    """Tag 200 GET responses so browsers can revalidate cheaply; a matching
+    If-None-Match turns a full rebuild into an empty 304"""
+    if (request.method == 'GET'
+            and response.status_code == 200
+            and not response.direct_passthrough):
+        response.add_etag()
+        response.headers.setdefault('Cache-Control', 'public, max-age=60')
+        return response.make_conditional(request)
+    return response
+
+# Parsed payloads keyed by path; entries carry (mtime_ns, size) so a rewritten
+# file is picked up while repeat requests skip the disk read and JSON parse
+_JSON_CACHE = {}
+
+
+# First number in a funding amount string, compiled once at import
+_AMOUNT_RE = re.compile(r'(\d+(?:\.\d+)?)')
+
+
+@lru_cache(maxsize=4096)
+def _parse_funding_amount(amount_str):
+    """Parse an amount string like '$55M+ Raised' into millions (memoized;
+    the same strings recur across requests)"""
+    if not amount_str:
+        return 0.0
+
+    match = _AMOUNT_RE.search(amount_str.replace(',', ''))
+    if not match:
+        return 0.0
+
+    value = float(match.group(1))
+
+    # One case-fold covers the unit letters and the spelled-out words
+    upper = amount_str.upper()
+    if 'B' in upper:
+        return value * 1000
+    elif 'M' in upper:
+        return value
+    elif 'K' in upper or 'THOUSAND' in upper:
+        return value / 1000
+    else:
+        return value
+
+
+def _attach_dates(records):
+    """Parse announcement_date once per record into a date object under '_date';
+    every filter then compares dates instead of re-running strptime"""
+    for rec in records:
+        stamp = rec.get('announcement_date')
+        if stamp:
+            y, m, d = stamp.split('-')
+            rec['_date'] = date(int(y), int(m), int(d))
+        else:
+            rec['_date'] = date.min
+
+
+def _public(records):
+    """Copy records without internal fields (leading underscore) for responses"""
+    return [{k: v for k, v in rec.items() if not k.startswith('_')} for rec in records]
+
+
+@lru_cache(maxsize=None)
+def _resolve_data_dir(preferred):
+    """Probe for the data directory (and create it) once per process; every
+    DashboardData after the first gets the answer without syscalls"""
+    data_dir = preferred if os.path.isdir(preferred) else "data"
+    os.makedirs(data_dir, exist_ok=True)
+    return data_dir
+
+
 class DashboardData:
+    # Summaries stay valid this long before we recompute (seconds)
+    SUMMARY_TTL = 60
+
     def __init__(self, data_dir: str = "../data"):
-        if not os.path.exists(data_dir):
-            data_dir = "data"
-        self.data_dir = data_dir
-        self.ensure_data_dir()
-    
-    def ensure_data_dir(self):
-        if not os.path.exists(self.data_dir):
-            os.makedirs(self.data_dir)
-    
-    def load_latest_commitments(self) -> List[Dict]:
+        self.data_dir = _resolve_data_dir(data_dir)
+        self._summary_cache = {}  # source key -> (expiry, summary)
+        self._summary_lock = threading.Lock()
+        self._latest_files = {}  # prefix -> (dir mtime_ns, path)
+        self._alerts_cache = None  # (key, top alerts, total)
+
+    def _latest(self, prefix):
+        """Newest data file for a prefix, via one directory scan.
+
+        DirEntry.stat() reuses the readdir result, so this is one opendir
+        instead of the stat-per-file that glob+getmtime costs.
+        """
         try:
-            pattern = os.path.join(self.data_dir, "commitments_*.json")
-            files = glob.glob(pattern)
-            if not files:
-                return []
-            
-            latest_file = max(files, key=os.path.getmtime)
-            with open(latest_file, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading commitments: {e}")
-            return []
+            with os.scandir(self.data_dir) as it:
+                return max(
+                    (e for e in it
+                     if e.name.startswith(prefix) and e.name.endswith('.json')),
+                    key=lambda e: e.stat().st_mtime_ns,
+                    default=None,
+                )
+        except FileNotFoundError:
+            return None
+
+    def _latest_path(self, prefix):
+        """Path of the newest data file for a prefix, rescanning only when the
+        data directory itself changes (new files bump the directory mtime)"""
+        try:
+            dir_mtime = os.stat(self.data_dir).st_mtime_ns
+        except FileNotFoundError:
+            return None
+        cached = self._latest_files.get(prefix)
+        if cached and cached[0] == dir_mtime:
+            return cached[1]
+        entry = self._latest(prefix)
+        path = entry.path if entry is not None else None
+        self._latest_files[prefix] = (dir_mtime, path)
+        return path
+
+    def _source_stats(self):
+        """Identify the current source files as ((path, mtime), ...) for cache keys"""
+        key = []
+        for prefix in ("commitments_", "funding_"):
+            path = self._latest_path(prefix)
+            if path is not None:
+                try:
+                    key.append((path, os.stat(path).st_mtime_ns))
+                except FileNotFoundError:
+                    pass
+        intelligence_file = os.path.join(self.data_dir, "carbon_intelligence.json")
+        try:
+            key.append((intelligence_file, os.stat(intelligence_file).st_mtime_ns))
+        except FileNotFoundError:
+            pass
+        return tuple(key)
     
-    def load_latest_funding(self) -> List[Dict]:
+    def _load_json(self, path):
+        """Parse a JSON file, reusing the cached result while the file is
+        unchanged. Returns (data, dates): list payloads come back date-sorted
+        with a parallel list of their '_date' values so recency cutoffs can be
+        found with bisect instead of a linear scan; dates is None for dicts."""
+        st = os.stat(path)
+        cached = _JSON_CACHE.get(path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2], cached[3]
+        # One binary read of the whole file; orjson parses UTF-8 bytes
+        # directly, skipping the text-mode decode pass json.load pays
+        with open(path, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson else json.loads(raw)
+        dates = None
+        if isinstance(data, list):
+            _attach_dates(data)
+            data.sort(key=itemgetter('_date'))
+            dates = [rec['_date'] for rec in data]
+        _JSON_CACHE[path] = (st.st_mtime_ns, st.st_size, data, dates)
+        return data, dates
+
+    def _load_tables(self, prefix):
+        """(records, dates) for the newest file of a prefix; both empty if none"""
         try:
-            pattern = os.path.join(self.data_dir, "funding_*.json")
-            files = glob.glob(pattern)
-            if not files:
-                return []
-            
-            latest_file = max(files, key=os.path.getmtime)
-            with open(latest_file, 'r') as f:
-                return json.load(f)
+            path = self._latest_path(prefix)
+            if path is None:
+                return [], []
+            return self._load_json(path)
         except Exception as e:
-            print(f"Error loading funding data: {e}")
-            return []
+            print(f"Error loading {prefix.rstrip('_')} data: {e}")
+            return [], []
+
+    def load_latest_commitments(self, since: Optional[date] = None) -> List[Dict]:
+        """Latest commitments, optionally only those dated `since` or later.
+        Tables are cached date-sorted, so the window is a bisect and a slice
+        rather than a filtering pass."""
+        records, dates = self._load_tables("commitments_")
+        if since is None:
+            return records
+        return records[bisect_left(dates, since):]
+
+    def load_latest_funding(self, since: Optional[date] = None) -> List[Dict]:
+        """Latest funding events, optionally only those dated `since` or later"""
+        records, dates = self._load_tables("funding_")
+        if since is None:
+            return records
+        return records[bisect_left(dates, since):]
     
     def load_agent_intelligence(self) -> Dict[str, Any]:
         """Load data from agent intelligence system"""
         try:
             intelligence_file = os.path.join(self.data_dir, "carbon_intelligence.json")
             if os.path.exists(intelligence_file):
-                with open(intelligence_file, 'r') as f:
-                    data = json.load(f)
-                    print(f"✅ Loaded agent intelligence data from {intelligence_file}")
-                    return data
+                data, _ = self._load_json(intelligence_file)
+                print(f"✅ Loaded agent intelligence data from {intelligence_file}")
+                return data
             else:
                 print(f"⚠️ No agent intelligence file found at {intelligence_file}")
                 return {}
@@ -77,6 +277,22 @@ class DashboardData:
             return {}
     
     def get_dashboard_summary(self) -> Dict[str, Any]:
+        """Return the dashboard summary, cached briefly so `/` and `/api/stats`
+        don't reload and re-filter the source files on every hit"""
+        key = self._source_stats()
+        with self._summary_lock:
+            cached = self._summary_cache.get(key)
+            if cached and time.monotonic() < cached[0]:
+                return cached[1]
+
+        summary = self._build_dashboard_summary()
+
+        with self._summary_lock:
+            # Replace the whole dict so entries for superseded files don't pile up
+            self._summary_cache = {key: (time.monotonic() + self.SUMMARY_TTL, summary)}
+        return summary
+
+    def _build_dashboard_summary(self) -> Dict[str, Any]:
         # Try to load agent intelligence first
         agent_data = self.load_agent_intelligence()
         
@@ -98,78 +314,119 @@ class DashboardData:
         
         # Fallback to scraped data
         print("📊 Using scraped/demo data")
-        commitments = self.load_latest_commitments()
-        funding = self.load_latest_funding()
-        
+        commitments, c_dates = self._load_tables("commitments_")
+        funding, f_dates = self._load_tables("funding_")
+
         today = datetime.now().date()
         three_years_ago = today - timedelta(days=1095)  # 3 years for historical funding data
         week_ago = today - timedelta(days=7)
-        
-        # Filter commitments to show recent developments, funding to show historical context
-        commitments = [
-            c for c in commitments 
-            if datetime.strptime(c['announcement_date'], '%Y-%m-%d').date() >= three_years_ago
-        ]
-        
-        funding = [
-            f for f in funding
-            if datetime.strptime(f['announcement_date'], '%Y-%m-%d').date() >= three_years_ago
-        ]
-        
-        recent_commitments = [
-            c for c in commitments 
-            if datetime.strptime(c['announcement_date'], '%Y-%m-%d').date() >= week_ago
-        ]
-        
-        recent_funding = [
-            f for f in funding
-            if datetime.strptime(f['announcement_date'], '%Y-%m-%d').date() >= week_ago
-        ]
-        
-        high_value_commitments = [c for c in commitments if c['relevance_score'] > 0.6]
-        competitive_threats = [f for f in funding if f.get('competitive_threat', 0) > 0.6]
-        partnership_opps = [f for f in funding if f.get('partnership_opportunity', 0) > 0.6]
-        
-        total_funding_value = sum([
-            self.parse_funding_amount(f.get('amount', '0')) or 0 
-            for f in funding
-        ])
-        
+
+        # Records are date-sorted, so the recency counts fall out of two
+        # bisects per list; only the score/amount stats still need a pass,
+        # fused over the in-window slice
+        c_start = bisect_left(c_dates, three_years_ago)
+        total_commitments = len(c_dates) - c_start
+        recent_commitments = len(c_dates) - bisect_left(c_dates, week_ago, c_start)
+        high_value_commitments = 0
+        for c in commitments[c_start:]:
+            if c['relevance_score'] > 0.6:
+                high_value_commitments += 1
+
+        parse_amount = self.parse_funding_amount
+        f_start = bisect_left(f_dates, three_years_ago)
+        total_funding_events = len(f_dates) - f_start
+        recent_funding_events = len(f_dates) - bisect_left(f_dates, week_ago, f_start)
+        competitive_threats = partnership_opps = 0
+        total_funding_value = 0.0
+        for f in funding[f_start:]:
+            if f.get('competitive_threat', 0) > 0.6:
+                competitive_threats += 1
+            if f.get('partnership_opportunity', 0) > 0.6:
+                partnership_opps += 1
+            total_funding_value += parse_amount(f.get('amount', '0')) or 0
+
         return {
-            'total_commitments': len(commitments),
-            'recent_commitments': len(recent_commitments),
-            'high_value_commitments': len(high_value_commitments),
-            'total_funding_events': len(funding),
-            'recent_funding_events': len(recent_funding),
+            'total_commitments': total_commitments,
+            'recent_commitments': recent_commitments,
+            'high_value_commitments': high_value_commitments,
+            'total_funding_events': total_funding_events,
+            'recent_funding_events': recent_funding_events,
             'total_funding_value': f"${total_funding_value:.1f}M",
-            'competitive_threats': len(competitive_threats),
-            'partnership_opportunities': len(partnership_opps),
+            'competitive_threats': competitive_threats,
+            'partnership_opportunities': partnership_opps,
             'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M UTC')
         }
     
+    def get_alerts(self):
+        """Top-20 high-priority alerts plus the full count, rebuilt only when
+        the source files change (or the 7-day window moves)"""
+        week_ago = datetime.now().date() - timedelta(days=7)
+        key = (self._source_stats(), week_ago)
+        cached = self._alerts_cache
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+
+        commitments, c_dates = self._load_tables("commitments_")
+        funding, _ = self._load_tables("funding_")
+
+        alerts = []
+
+        # One pass per list: bisect to the week-old boundary for commitments,
+        # then classify and build the alert dicts in the same loop
+        for commitment in commitments[bisect_left(c_dates, week_ago):]:
+            if commitment['relevance_score'] <= 0.6:
+                continue
+            alerts.append({
+                'type': 'commitment',
+                'priority': 'high',
+                'title': f"🎯 High-Value Commitment: {commitment['company']}",
+                'description': f"{commitment['commitment_type']} target, relevance score {commitment['relevance_score']:.2f}",
+                'action': commitment['dovu_opportunity'],
+                'date': commitment['announcement_date'],
+                'source_url': commitment.get('source_url', '')
+            })
+
+        for event in funding:
+            if event.get('competitive_threat', 0) > 0.6:
+                alerts.append({
+                    'type': 'threat',
+                    'priority': 'urgent',
+                    'title': f"⚠️ Competitive Threat: {event['company']}",
+                    'description': f"{event['funding_type']} {event.get('amount', '')} - threat score {event.get('competitive_threat', 0):.2f}",
+                    'action': "Monitor product development and market positioning",
+                    'date': event['announcement_date'],
+                    'source_url': event.get('source_url', '')
+                })
+            if event.get('partnership_opportunity', 0) > 0.6:
+                alerts.append({
+                    'type': 'partnership',
+                    'priority': 'medium',
+                    'title': f"🤝 Partnership Opportunity: {event['company']}",
+                    'description': f"{event['business_model']} - partnership score {event.get('partnership_opportunity', 0):.2f}",
+                    'action': "Evaluate integration and partnership potential",
+                    'date': event['announcement_date'],
+                    'source_url': event.get('source_url', '')
+                })
+
+
+        # Top 20 newest; nlargest avoids sorting the whole list just to slice it
+        top_alerts = heapq.nlargest(20, alerts, key=itemgetter('date'))
+
+        self._alerts_cache = (key, top_alerts, len(alerts))
+        return top_alerts, len(alerts)
+
     def parse_funding_amount(self, amount_str: str) -> float:
-        if not amount_str:
-            return 0.0
-        
-        import re
-        match = re.search(r'(\d+(?:\.\d+)?)', amount_str.replace(',', ''))
-        if not match:
-            return 0.0
-        
-        value = float(match.group(1))
-        
-        if 'B' in amount_str.upper() or 'billion' in amount_str.lower():
-            return value * 1000
-        elif 'M' in amount_str.upper() or 'million' in amount_str.lower():
-            return value
-        elif 'K' in amount_str.upper() or 'thousand' in amount_str.lower():
-            return value / 1000
-        else:
-            return value
+        return _parse_funding_amount(amount_str)
 
 # Initialize data handler
 dashboard_data = DashboardData()
 
+# Prime the JSON, summary and alert caches so the first request isn't a cold
+# miss; PRELOAD=0 opts out (e.g. in tests that stub the data directory)
+if os.environ.get('PRELOAD', '1') == '1':
+    dashboard_data.get_dashboard_summary()
+    dashboard_data.get_alerts()
+
 @app.route('/')
 def dashboard():
     """Main dashboard page"""
@@ -179,8 +436,6 @@ def dashboard():
 @app.route('/api/commitments')
 def api_commitments():
     """API endpoint for commitment data - OPEN ACCESS"""
-    commitments = dashboard_data.load_latest_commitments()
-    
     # Apply filters with safe defaults - 3 years max for real historical data
     try:
         min_relevance = max(0, min(1, float(request.args.get('min_relevance', 0))))
@@ -190,37 +445,39 @@ def api_commitments():
         min_relevance = 0
         days_back = 1095  # Default to 3 years for historical context
         commitment_type = ''
-    
-    # Filter by date
-    cutoff_date = datetime.now() - timedelta(days=days_back)
-    filtered = [
-        c for c in commitments
-        if datetime.strptime(c['announcement_date'], '%Y-%m-%d') >= cutoff_date
-    ]
-    
-    # Filter by relevance
-    if min_relevance > 0:
-        filtered = [c for c in filtered if c['relevance_score'] >= min_relevance]
-    
-    # Filter by type
-    if commitment_type:
-        filtered = [c for c in filtered if c['commitment_type'] == commitment_type]
-    
-    return jsonify({
-        'commitments': filtered,
-        'total': len(filtered),
-        'filters_applied': {
-            'min_relevance': min_relevance,
-            'commitment_type': commitment_type,
-            'days_back': days_back
+
+    # Records are date-sorted; bisect finds the cutoff in O(log n)
+    cutoff_date = (datetime.now() - timedelta(days=days_back)).date()
+
+    def build():
+        commitments, dates = dashboard_data._load_tables("commitments_")
+        filtered = commitments[bisect_left(dates, cutoff_date):]
+
+        # Filter by relevance
+        if min_relevance > 0:
+            filtered = [c for c in filtered if c['relevance_score'] >= min_relevance]
+
+        # Filter by type
+        if commitment_type:
+            filtered = [c for c in filtered if c['commitment_type'] == commitment_type]
+
+        return {
+            'commitments': _public(filtered),
+            'total': len(filtered),
+            'filters_applied': {
+                'min_relevance': min_relevance,
+                'commitment_type': commitment_type,
+                'days_back': days_back
+            }
         }
-    })
+
+    key = ('commitments', dashboard_data._source_stats(), cutoff_date,
+           min_relevance, commitment_type)
+    return _cached_response(key, build)
 
 @app.route('/api/funding')
 def api_funding():
     """API endpoint for funding data - OPEN ACCESS"""
-    funding = dashboard_data.load_latest_funding()
-    
     # Apply filters with safe defaults - 3 years max for real historical data
     try:
         min_relevance = max(0, min(1, float(request.args.get('min_relevance', 0))))
@@ -234,104 +491,56 @@ def api_funding():
         sector = ''
         min_threat = 0
         min_partnership = 0
-    
-    # Filter by date
-    cutoff_date = datetime.now() - timedelta(days=days_back)
-    filtered = [
-        f for f in funding
-        if datetime.strptime(f['announcement_date'], '%Y-%m-%d') >= cutoff_date
-    ]
-    
-    # Apply filters
-    if min_relevance > 0:
-        filtered = [f for f in filtered if f.get('dovu_relevance', 0) >= min_relevance]
-    
-    if sector:
-        filtered = [f for f in filtered if f.get('sector') == sector]
-    
-    if min_threat > 0:
-        filtered = [f for f in filtered if f.get('competitive_threat', 0) >= min_threat]
-    
-    if min_partnership > 0:
-        filtered = [f for f in filtered if f.get('partnership_opportunity', 0) >= min_partnership]
-    
-    return jsonify({
-        'funding_events': filtered,
-        'total': len(filtered),
-        'filters_applied': {
-            'min_relevance': min_relevance,
-            'sector': sector,
-            'min_threat': min_threat,
-            'min_partnership': min_partnership,
-            'days_back': days_back
+
+    # Records are date-sorted; bisect finds the cutoff in O(log n)
+    cutoff_date = (datetime.now() - timedelta(days=days_back)).date()
+
+    def build():
+        funding, dates = dashboard_data._load_tables("funding_")
+        filtered = funding[bisect_left(dates, cutoff_date):]
+
+        # Apply filters
+        if min_relevance > 0:
+            filtered = [f for f in filtered if f.get('dovu_relevance', 0) >= min_relevance]
+
+        if sector:
+            filtered = [f for f in filtered if f.get('sector') == sector]
+
+        if min_threat > 0:
+            filtered = [f for f in filtered if f.get('competitive_threat', 0) >= min_threat]
+
+        if min_partnership > 0:
+            filtered = [f for f in filtered if f.get('partnership_opportunity', 0) >= min_partnership]
+
+        return {
+            'funding_events': _public(filtered),
+            'total': len(filtered),
+            'filters_applied': {
+                'min_relevance': min_relevance,
+                'sector': sector,
+                'min_threat': min_threat,
+                'min_partnership': min_partnership,
+                'days_back': days_back
+            }
         }
-    })
+
+    key = ('funding', dashboard_data._source_stats(), cutoff_date,
+           min_relevance, sector, min_threat, min_partnership)
+    return _cached_response(key, build)
 
 @app.route('/api/alerts')
 def api_alerts():
     """API endpoint for high-priority alerts - OPEN ACCESS"""
-    commitments = dashboard_data.load_latest_commitments()
-    funding = dashboard_data.load_latest_funding()
-    
-    alerts = []
-    
-    # High-relevance commitments from last 7 days
-    week_ago = datetime.now() - timedelta(days=7)
-    recent_high_value = [
-        c for c in commitments
-        if (datetime.strptime(c['announcement_date'], '%Y-%m-%d') >= week_ago 
-            and c['relevance_score'] > 0.6)
-    ]
-    
-    for commitment in recent_high_value:
-        alerts.append({
-            'type': 'commitment',
-            'priority': 'high',
-            'title': f"🎯 High-Value Commitment: {commitment['company']}",
-            'description': f"{commitment['commitment_type']} target, relevance score {commitment['relevance_score']:.2f}",
-            'action': commitment['dovu_opportunity'],
-            'date': commitment['announcement_date'],
-            'source_url': commitment.get('source_url', '')
-        })
-    
-    # Competitive threats
-    threats = [f for f in funding if f.get('competitive_threat', 0) > 0.6]
-    for threat in threats:
-        alerts.append({
-            'type': 'threat',
-            'priority': 'urgent',
-            'title': f"⚠️ Competitive Threat: {threat['company']}",
-            'description': f"{threat['funding_type']} {threat.get('amount', '')} - threat score {threat.get('competitive_threat', 0):.2f}",
-            'action': "Monitor product development and market positioning",
-            'date': threat['announcement_date'],
-            'source_url': threat.get('source_url', '')
-        })
-    
-    # Partnership opportunities
-    partnerships = [f for f in funding if f.get('partnership_opportunity', 0) > 0.6]
-    for opp in partnerships:
-        alerts.append({
-            'type': 'partnership',
-            'priority': 'medium',
-            'title': f"🤝 Partnership Opportunity: {opp['company']}",
-            'description': f"{opp['business_model']} - partnership score {opp.get('partnership_opportunity', 0):.2f}",
-            'action': "Evaluate integration and partnership potential",
-            'date': opp['announcement_date'],
-            'source_url': opp.get('source_url', '')
-        })
-    
-    # Sort by date (newest first)
-    alerts.sort(key=lambda x: x['date'], reverse=True)
-    
-    return jsonify({
-        'alerts': alerts[:20],  # Limit to top 20
-        'total': len(alerts)
+    top_alerts, total = dashboard_data.get_alerts()
+    return fast_jsonify({
+        'alerts': top_alerts,
+        'total': total
     })
 
 @app.route('/api/stats')
 def api_stats():
     """API endpoint for dashboard statistics"""
-    return jsonify(dashboard_data.get_dashboard_summary())
+    return fast_jsonify(dashboard_data.get_dashboard_summary())
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
@@ -342,4 +551,6 @@ if __name__ == '__main__':
     print(f"🔓 Team can access all endpoints directly")
     print(f"🌐 Port: {port}")
     
-    app.run(debug=debug, host='0.0.0.0', port=port)
\ No newline at end of file
+    # threaded=True lets one request's disk I/O overlap with another's
+    # serialization instead of queueing every client behind a single worker
+    app.run(debug=debug, host='0.0.0.0', port=port, threaded=True)
\ No newline at end of file
@@ -7,12 +7,40 @@ Open access for team collaboration
 from flask import Flask, render_template, jsonify, request
 import json
 import os
+import threading
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
 import glob
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json
+
 app = Flask(__name__)
 
+
+def fast_jsonify(obj):
+    """JSON response via orjson when available (3-6x faster than jsonify)"""
+    if orjson is None:
+        return jsonify(obj)
+    return app.response_class(orjson.dumps(obj), mimetype='application/json')
+
+
+def _attach_ordinals(records):
+    """Parse announcement_date once per record into a day ordinal under '_ts'
+    so the filters compare integers instead of re-running strptime"""
+    for rec in records:
+        try:
+            rec['_ts'] = datetime.strptime(rec['announcement_date'], '%Y-%m-%d').toordinal()
+        except (KeyError, ValueError, TypeError):
+            rec['_ts'] = -1
+
+
+def _public(records):
+    """Copy records without internal fields (leading underscore) for responses"""
+    return [{k: v for k, v in rec.items() if not k.startswith('_')} for rec in records]
+
 # Security headers (keep these for basic protection)
 @app.after_request
 def add_security_headers(response):
@@ -27,35 +55,53 @@ class DashboardData:
             data_dir = "data"
         self.data_dir = data_dir
         self.ensure_data_dir()
-    
+        self._cache = {}  # (path, mtime) -> parsed list
+        self._cache_lock = threading.Lock()
+
     def ensure_data_dir(self):
         if not os.path.exists(self.data_dir):
             os.makedirs(self.data_dir)
-    
+
+    def _load_latest(self, prefix) -> List[Dict]:
+        """Parse the newest file for a prefix, reusing the cached list while
+        the file is unchanged (a request burst re-parses nothing)"""
+        pattern = os.path.join(self.data_dir, f"{prefix}*.json")
+        files = glob.glob(pattern)
+        if not files:
+            return []
+
+        latest_file = max(files, key=os.path.getmtime)
+        key = (latest_file, os.path.getmtime(latest_file))
+        data = self._cache.get(key)
+        if data is not None:
+            return data
+
+        # Lock the populate step so concurrent workers parse once, not N times
+        with self._cache_lock:
+            data = self._cache.get(key)
+            if data is None:
+                # orjson parses the raw bytes directly, skipping text decode
+                with open(latest_file, 'rb') as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson else json.loads(raw)
+                if isinstance(data, list):
+                    _attach_ordinals(data)
+                # One entry per prefix; superseded files shouldn't accumulate
+                self._cache = {k: v for k, v in self._cache.items()
+                               if not k[0].startswith(os.path.join(self.data_dir, prefix))}
+                self._cache[key] = data
+        return data
+
     def load_latest_commitments(self) -> List[Dict]:
         try:
-            pattern = os.path.join(self.data_dir, "commitments_*.json")
-            files = glob.glob(pattern)
-            if not files:
-                return []
-            
-            latest_file = max(files, key=os.path.getmtime)
-            with open(latest_file, 'r') as f:
-                return json.load(f)
+            return self._load_latest("commitments_")
         except Exception as e:
             print(f"Error loading commitments: {e}")
             return []
-    
+
     def load_latest_funding(self) -> List[Dict]:
         try:
-            pattern = os.path.join(self.data_dir, "funding_*.json")
-            files = glob.glob(pattern)
-            if not files:
-                return []
-            
-            latest_file = max(files, key=os.path.getmtime)
-            with open(latest_file, 'r') as f:
-                return json.load(f)
+            return self._load_latest("funding_")
         except Exception as e:
             print(f"Error loading funding data: {e}")
             return []
@@ -64,30 +110,21 @@ class DashboardData:
         commitments = self.load_latest_commitments()
         funding = self.load_latest_funding()
         
-        today = datetime.now().date()
-        six_months_ago = today - timedelta(days=180)  # 6 months filter
-        week_ago = today - timedelta(days=7)
-        
-        # Filter all data to last 6 months
-        commitments = [
-            c for c in commitments 
-            if datetime.strptime(c['announcement_date'], '%Y-%m-%d').date() >= six_months_ago
-        ]
-        
-        funding = [
-            f for f in funding
-            if datetime.strptime(f['announcement_date'], '%Y-%m-%d').date() >= six_months_ago
-        ]
-        
-        recent_commitments = [
-            c for c in commitments 
-            if datetime.strptime(c['announcement_date'], '%Y-%m-%d').date() >= week_ago
-        ]
-        
-        recent_funding = [
-            f for f in funding
-            if datetime.strptime(f['announcement_date'], '%Y-%m-%d').date() >= week_ago
-        ]
+        # One clock read per summary; the cutoffs and last_updated share it
+        now = datetime.now()
+        today = now.date()
+        six_months_ago_ord = (today - timedelta(days=180)).toordinal()  # 6 months filter
+        week_ago_ord = (today - timedelta(days=7)).toordinal()
+
+        # Filter all data to last 6 months; '_ts' is preparsed at load so
+        # these are plain integer compares
+        commitments = [c for c in commitments if c['_ts'] >= six_months_ago_ord]
+
+        funding = [f for f in funding if f['_ts'] >= six_months_ago_ord]
+
+        recent_commitments = [c for c in commitments if c['_ts'] >= week_ago_ord]
+
+        recent_funding = [f for f in funding if f['_ts'] >= week_ago_ord]
         
         high_value_commitments = [c for c in commitments if c['relevance_score'] > 0.6]
         competitive_threats = [f for f in funding if f.get('competitive_threat', 0) > 0.6]
@@ -107,7 +144,7 @@ class DashboardData:
             'total_funding_value': f"${total_funding_value:.1f}M",
             'competitive_threats': len(competitive_threats),
             'partnership_opportunities': len(partnership_opps),
-            'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M UTC')
+            'last_updated': now.strftime('%Y-%m-%d %H:%M UTC')
         }
     
     def parse_funding_amount(self, amount_str: str) -> float:
@@ -154,12 +191,10 @@ def api_commitments():
         days_back = 180  # Default to 6 months
         commitment_type = ''
     
-    # Filter by date
-    cutoff_date = datetime.now() - timedelta(days=days_back)
-    filtered = [
-        c for c in commitments
-        if datetime.strptime(c['announcement_date'], '%Y-%m-%d') >= cutoff_date
-    ]
+    # Filter by date; ISO dates sort lexicographically, so a plain string
+    # compare replaces strptime on both sides
+    cutoff_str = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
+    filtered = [c for c in commitments if c['announcement_date'] >= cutoff_str]
     
     # Filter by relevance
     if min_relevance > 0:
@@ -169,8 +204,8 @@ def api_commitments():
     if commitment_type:
         filtered = [c for c in filtered if c['commitment_type'] == commitment_type]
     
-    return jsonify({
-        'commitments': filtered,
+    return fast_jsonify({
+        'commitments': _public(filtered),
         'total': len(filtered),
         'filters_applied': {
             'min_relevance': min_relevance,
@@ -198,12 +233,10 @@ def api_funding():
         min_threat = 0
         min_partnership = 0
     
-    # Filter by date
-    cutoff_date = datetime.now() - timedelta(days=days_back)
-    filtered = [
-        f for f in funding
-        if datetime.strptime(f['announcement_date'], '%Y-%m-%d') >= cutoff_date
-    ]
+    # Filter by date; ISO dates sort lexicographically, so a plain string
+    # compare replaces strptime on both sides
+    cutoff_str = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
+    filtered = [f for f in funding if f['announcement_date'] >= cutoff_str]
     
     # Apply filters
     if min_relevance > 0:
@@ -218,8 +251,8 @@ def api_funding():
     if min_partnership > 0:
         filtered = [f for f in filtered if f.get('partnership_opportunity', 0) >= min_partnership]
     
-    return jsonify({
-        'funding_events': filtered,
+    return fast_jsonify({
+        'funding_events': _public(filtered),
         'total': len(filtered),
         'filters_applied': {
             'min_relevance': min_relevance,
@@ -238,12 +271,11 @@ def api_alerts():
     
     alerts = []
     
-    # High-relevance commitments from last 7 days
-    week_ago = datetime.now() - timedelta(days=7)
+    # High-relevance commitments from last 7 days (ISO string compare)
+    week_ago_str = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
     recent_high_value = [
         c for c in commitments
-        if (datetime.strptime(c['announcement_date'], '%Y-%m-%d') >= week_ago 
-            and c['relevance_score'] > 0.6)
+        if c['announcement_date'] >= week_ago_str and c['relevance_score'] > 0.6
     ]
     
     for commitment in recent_high_value:
@@ -286,7 +318,7 @@ def api_alerts():
     # Sort by date (newest first)
     alerts.sort(key=lambda x: x['date'], reverse=True)
     
-    return jsonify({
+    return fast_jsonify({
         'alerts': alerts[:20],  # Limit to top 20
         'total': len(alerts)
     })
@@ -294,7 +326,7 @@ def api_alerts():
 @app.route('/api/stats')
 def api_stats():
     """API endpoint for dashboard statistics"""
-    return jsonify(dashboard_data.get_dashboard_summary())
+    return fast_jsonify(dashboard_data.get_dashboard_summary())
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
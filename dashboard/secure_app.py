@@ -6,18 +6,28 @@ Security-hardened version with authentication and input validation
 
 from flask import Flask, render_template, jsonify, request, abort
 from functools import wraps
+import heapq
 import json
 import os
 import re
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
-import glob
 import logging
 
 # Configure secure logging
 logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
+# Hot-path patterns, compiled once at import instead of per request/call
+_SAFE_ID_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+
+# Deletes every ASCII char that isn't part of a number or a B/M/K suffix;
+# str.translate is a single C pass, no regex engine involved
+_AMOUNT_TBL = str.maketrans(
+    '', '', ''.join(chr(c) for c in range(128) if chr(c) not in '0123456789.MBK'))
+
 app = Flask(__name__)
 
 # Security configuration
@@ -63,12 +73,12 @@ def validate_query_params():
         
         commitment_type = request.args.get('type', '')
         # Sanitize commitment type
-        if commitment_type and not re.match(r'^[a-zA-Z0-9_-]+$', commitment_type):
+        if commitment_type and not _SAFE_ID_RE.match(commitment_type):
             commitment_type = ''
-            
+
         sector = request.args.get('sector', '')
         # Sanitize sector
-        if sector and not re.match(r'^[a-zA-Z0-9_-]+$', sector):
+        if sector and not _SAFE_ID_RE.match(sector):
             sector = ''
             
         min_threat = float(request.args.get('min_threat', 0))
@@ -89,13 +99,31 @@ def validate_query_params():
         logger.warning(f"Invalid query parameters: {e}")
         abort(400, description="Invalid parameters")
 
+def _public(records):
+    """Copy records without internal fields (leading underscore) for responses"""
+    return [{k: v for k, v in rec.items() if not k.startswith('_')} for rec in records]
+
+
 class DashboardData:
+    # Summaries may be served this stale, in seconds; '/' and '/api/stats'
+    # are unauthenticated, so recomputing per hit is a free DoS amplifier
+    SUMMARY_TTL = 30
+
     def __init__(self, data_dir: str = "../data"):
-        # Handle both local and cloud deployment paths
-        if not os.path.exists(data_dir):
-            data_dir = "data"  # Fallback for cloud deployment
-        self.data_dir = data_dir
-        self.ensure_data_dir()
+        # Only record the preferred path; directory resolution and the
+        # first parse happen in _ensure_loaded so importing the module
+        # stays cheap and forked workers don't redo discovery
+        self._preferred_dir = data_dir
+        self.data_dir = data_dir  # resolved on first use
+        self._loaded = False
+        self._load_lock = threading.Lock()
+        self._summary_cache = (0.0, None, 0.0)  # (source mtime key, dict, built at)
+        self._cache = {}  # prefix -> ((path, mtime), parsed list)
+        # Dict-of-lists indices rebuilt on each load; a sector or type
+        # filter becomes one dict lookup instead of a full scan
+        self._by_sector = {}  # sector -> funding records
+        self._by_type = {}    # commitment_type -> commitment records
+        self._last_good = {}  # prefix -> last successfully parsed list
     
     def ensure_data_dir(self):
         """Ensure data directory exists"""
@@ -105,120 +133,216 @@ class DashboardData:
         except Exception:
             logger.error("Failed to create data directory")
     
-    def load_latest_commitments(self) -> List[Dict]:
-        """Load latest corporate commitment data"""
+    def _ensure_loaded(self):
+        """Resolve the data directory and warm both parse caches, once.
+        Under gunicorn --preload, calling this in the master lets forked
+        workers share the parsed lists copy-on-write."""
+        if self._loaded:
+            return
+        with self._load_lock:
+            if self._loaded:
+                return
+            # Handle both local and cloud deployment paths
+            if os.path.exists(self._preferred_dir):
+                self.data_dir = self._preferred_dir
+            else:
+                self.data_dir = "data"  # Fallback for cloud deployment
+            self.ensure_data_dir()
+            self._loaded = True
+        self.load_latest_commitments()
+        self.load_latest_funding()
+
+    def _latest(self, prefix):
+        """Newest (path, mtime) for a data-file prefix via one directory scan;
+        DirEntry.stat() reuses the readdir result instead of a stat per file"""
+        self._ensure_loaded()
+        best = None
+        best_mt = -1.0
+        try:
+            with os.scandir(self.data_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith(prefix) and name.endswith('.json'):
+                        mt = entry.stat().st_mtime
+                        if mt > best_mt:
+                            best, best_mt = entry.path, mt
+        except FileNotFoundError:
+            pass
+        return best, best_mt
+
+    # Refuse to parse data files beyond this size; the record cap below keeps
+    # only 1000 items anyway, so anything bigger is malformed or hostile
+    MAX_DATA_FILE_BYTES = 64 * 1024 * 1024
+
+    # Score fields normalized to float at load (-1.0 for junk values) so the
+    # filters are a single C-level float compare, no isinstance per record
+    SCORE_FIELDS = ('relevance_score', 'dovu_relevance',
+                    'competitive_threat', 'partnership_opportunity')
+
+    def _load_latest(self, prefix) -> List[Dict]:
+        """Parse the newest file for a prefix, reusing the cached list while
+        the file is unchanged"""
+        latest_file, mtime = self._latest(prefix)
+        if latest_file is None:
+            return []
+
+        key = (latest_file, mtime)
+        cached = self._cache.get(prefix)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        if os.path.getsize(latest_file) > self.MAX_DATA_FILE_BYTES:
+            logger.warning(f"Refusing oversized data file {latest_file}")
+            if prefix == "funding_":
+                self._by_sector = {}
+            elif prefix == "commitments_":
+                self._by_type = {}
+            return []
+
         try:
-            pattern = os.path.join(self.data_dir, "commitments_*.json")
-            files = glob.glob(pattern)
-            if not files:
-                return []
-            
-            latest_file = max(files, key=os.path.getmtime)
             with open(latest_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-                # Validate data structure
-                if isinstance(data, list):
-                    return data[:1000]  # Limit to prevent memory issues
-                return []
+        except (OSError, ValueError):
+            # A scraper may be mid-write; serve the previous good parse
+            # instead of blanking the dashboard until the next refresh
+            logger.warning(f"Failed to parse {latest_file}; serving last good data")
+            return self._last_good.get(prefix, [])
+        # Validate data structure
+        if isinstance(data, list):
+            data = data[:1000]  # Limit to prevent memory issues
+        else:
+            data = []
+        # Parse each announcement date once, to a day ordinal; filters then
+        # compare integers, with -1 marking records with unusable dates
+        index_field = 'sector' if prefix == "funding_" else 'commitment_type'
+        index = {}
+        for rec in data:
+            try:
+                rec['_ts'] = datetime.strptime(rec['announcement_date'], '%Y-%m-%d').toordinal()
+            except (KeyError, ValueError, TypeError):
+                rec['_ts'] = -1
+            for field in self.SCORE_FIELDS:
+                if field in rec:
+                    try:
+                        rec[field] = float(rec[field])
+                    except (TypeError, ValueError):
+                        rec[field] = -1.0
+            group = rec.get(index_field)
+            if isinstance(group, str):
+                index.setdefault(group, []).append(rec)
+        if prefix == "funding_":
+            self._by_sector = index
+        elif prefix == "commitments_":
+            self._by_type = index
+        self._cache[prefix] = (key, data)
+        self._last_good[prefix] = data
+        return data
+
+    def load_latest_commitments(self) -> List[Dict]:
+        """Load latest corporate commitment data"""
+        try:
+            return self._load_latest("commitments_")
         except Exception:
             logger.warning("Error loading commitments data")
             return []
-    
+
     def load_latest_funding(self) -> List[Dict]:
         """Load latest funding event data"""
         try:
-            pattern = os.path.join(self.data_dir, "funding_*.json")
-            files = glob.glob(pattern)
-            if not files:
-                return []
-            
-            latest_file = max(files, key=os.path.getmtime)
-            with open(latest_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Validate data structure
-                if isinstance(data, list):
-                    return data[:1000]  # Limit to prevent memory issues
-                return []
+            return self._load_latest("funding_")
         except Exception:
             logger.warning("Error loading funding data")
             return []
+
+    def commitments_by_type(self, commitment_type: str) -> List[Dict]:
+        """Commitments for one type via the load-time index"""
+        self.load_latest_commitments()  # refresh the index if the file changed
+        return self._by_type.get(commitment_type, [])
+
+    def funding_by_sector(self, sector: str) -> List[Dict]:
+        """Funding events for one sector via the load-time index"""
+        self.load_latest_funding()  # refresh the index if the file changed
+        return self._by_sector.get(sector, [])
     
+    def _source_mtime_key(self) -> float:
+        """Cheap fingerprint of the source files: sum of the newest mtimes"""
+        mt_key = 0.0
+        try:
+            for prefix in ("commitments_", "funding_"):
+                _, mtime = self._latest(prefix)
+                if mtime > 0:
+                    mt_key += mtime
+        except Exception:
+            logger.warning("Error fingerprinting data files")
+        return mt_key
+
     def get_dashboard_summary(self) -> Dict[str, Any]:
-        """Get summary statistics for dashboard"""
+        """Get summary statistics for dashboard (cached until the source
+        files change, for at most SUMMARY_TTL seconds)"""
+        mt_key = self._source_mtime_key()
+        cached_mt, cached, built = self._summary_cache
+        if cached is not None and mt_key == cached_mt and time.time() - built < self.SUMMARY_TTL:
+            return cached
+
+        summary = self._build_dashboard_summary()
+        self._summary_cache = (mt_key, summary, time.time())
+        return summary
+
+    def _build_dashboard_summary(self) -> Dict[str, Any]:
+        """Compute summary statistics for dashboard"""
         try:
             commitments = self.load_latest_commitments()
             funding = self.load_latest_funding()
-            
-            # Calculate key metrics safely
-            today = datetime.now().date()
-            six_months_ago = today - timedelta(days=180)  # 6 months filter
-            week_ago = today - timedelta(days=7)
-            
-            # Filter all data to last 6 months
-            filtered_commitments = []
-            filtered_funding = []
-            
-            for c in commitments:
-                try:
-                    if datetime.strptime(c['announcement_date'], '%Y-%m-%d').date() >= six_months_ago:
-                        filtered_commitments.append(c)
-                except (KeyError, ValueError, TypeError):
-                    continue
-                    
-            for f in funding:
-                try:
-                    if datetime.strptime(f['announcement_date'], '%Y-%m-%d').date() >= six_months_ago:
-                        filtered_funding.append(f)
-                except (KeyError, ValueError, TypeError):
-                    continue
-            
-            # Use filtered data for calculations
-            commitments = filtered_commitments
-            funding = filtered_funding
-            
-            recent_commitments = []
-            recent_funding = []
-            
+
+            # Calculate key metrics safely; one clock read serves the whole
+            # summary (window cutoffs and the last_updated stamp)
+            now = datetime.now()
+            today = now.date()
+            six_months_ago_ord = (today - timedelta(days=180)).toordinal()  # 6 months filter
+            week_ago_ord = (today - timedelta(days=7)).toordinal()
+
+            # One fused pass per list: the 6-month window, the weekly counts
+            # and the score thresholds all come from the same loop, and the
+            # preparsed '_ts' ordinal replaces strptime-with-try/except
+            total_commitments = recent_commitments = high_value_commitments = 0
             for c in commitments:
-                try:
-                    if datetime.strptime(c['announcement_date'], '%Y-%m-%d').date() >= week_ago:
-                        recent_commitments.append(c)
-                except (KeyError, ValueError, TypeError):
+                ts = c.get('_ts', -1)
+                if ts < six_months_ago_ord:
                     continue
-            
-            for f in funding:
-                try:
-                    if datetime.strptime(f['announcement_date'], '%Y-%m-%d').date() >= week_ago:
-                        recent_funding.append(f)
-                except (KeyError, ValueError, TypeError):
-                    continue
-            
-            high_value_commitments = [c for c in commitments 
-                                    if isinstance(c.get('relevance_score'), (int, float)) and c['relevance_score'] > 0.6]
-            competitive_threats = [f for f in funding 
-                                 if isinstance(f.get('competitive_threat'), (int, float)) and f['competitive_threat'] > 0.6]
-            partnership_opps = [f for f in funding 
-                              if isinstance(f.get('partnership_opportunity'), (int, float)) and f['partnership_opportunity'] > 0.6]
-            
+                total_commitments += 1
+                if ts >= week_ago_ord:
+                    recent_commitments += 1
+                if c.get('relevance_score', -1.0) > 0.6:
+                    high_value_commitments += 1
+
+            total_funding_events = recent_funding_events = 0
+            competitive_threats = partnership_opps = 0
             total_funding_value = 0
             for f in funding:
-                try:
-                    amount = self.parse_funding_amount(f.get('amount', '0'))
-                    if isinstance(amount, (int, float)) and amount > 0:
-                        total_funding_value += amount
-                except:
+                ts = f.get('_ts', -1)
+                if ts < six_months_ago_ord:
                     continue
-            
+                total_funding_events += 1
+                if ts >= week_ago_ord:
+                    recent_funding_events += 1
+                if f.get('competitive_threat', -1.0) > 0.6:
+                    competitive_threats += 1
+                if f.get('partnership_opportunity', -1.0) > 0.6:
+                    partnership_opps += 1
+                amount = self.parse_funding_amount(f.get('amount', '0'))
+                if amount > 0:
+                    total_funding_value += amount
+
             return {
-                'total_commitments': len(commitments),
-                'recent_commitments': len(recent_commitments),
-                'high_value_commitments': len(high_value_commitments),
-                'total_funding_events': len(funding),
-                'recent_funding_events': len(recent_funding),
+                'total_commitments': total_commitments,
+                'recent_commitments': recent_commitments,
+                'high_value_commitments': high_value_commitments,
+                'total_funding_events': total_funding_events,
+                'recent_funding_events': recent_funding_events,
                 'total_funding_value': f"${total_funding_value:.1f}M",
-                'competitive_threats': len(competitive_threats),
-                'partnership_opportunities': len(partnership_opps),
-                'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M UTC')
+                'competitive_threats': competitive_threats,
+                'partnership_opportunities': partnership_opps,
+                'last_updated': now.strftime('%Y-%m-%d %H:%M UTC')
             }
         except Exception:
             logger.error("Error generating dashboard summary")
@@ -239,14 +363,30 @@ class DashboardData:
         try:
             if not amount_str or not isinstance(amount_str, str):
                 return 0.0
-            
+
+            # Hard cap: a pathological multi-MB "amount" shouldn't cost more
+            # than a real one (legitimate values are far shorter than this)
+            if len(amount_str) > 32:
+                return 0.0
+
             # Remove common formatting
-            clean_amount = re.sub(r'[^\d.MBK]', '', amount_str.upper())
-            match = re.search(r'(\d+(?:\.\d+)?)', clean_amount)
-            if not match:
+            clean_amount = amount_str.upper().translate(_AMOUNT_TBL)
+
+            # First number in the cleaned string, scanned without regex
+            i, n = 0, len(clean_amount)
+            while i < n and not clean_amount[i].isdigit():
+                i += 1
+            if i == n:
                 return 0.0
-            
-            value = float(match.group(1))
+            j = i + 1
+            while j < n and clean_amount[j].isdigit():
+                j += 1
+            if j + 1 < n and clean_amount[j] == '.' and clean_amount[j + 1].isdigit():
+                j += 2
+                while j < n and clean_amount[j].isdigit():
+                    j += 1
+
+            value = float(clean_amount[i:j])
             
             if 'B' in clean_amount:
                 return value * 1000
@@ -259,9 +399,15 @@ class DashboardData:
         except:
             return 0.0
 
-# Initialize data handler
+# Initialize data handler; construction is cheap, the first request (or
+# the preload block below) triggers the actual load
 dashboard_data = DashboardData()
 
+if os.environ.get('PRELOAD') == '1':
+    # Warm in the gunicorn --preload master so workers fork with the
+    # parsed lists already resident (shared copy-on-write)
+    dashboard_data._ensure_loaded()
+
 @app.route('/')
 def dashboard():
     """Main dashboard page - public access"""
@@ -279,32 +425,26 @@ def api_commitments():
     params = validate_query_params()
     
     try:
-        commitments = dashboard_data.load_latest_commitments()
-        
-        # Filter by date
-        cutoff_date = datetime.now() - timedelta(days=params['days_back'])
-        filtered = []
-        
-        for c in commitments:
-            try:
-                if datetime.strptime(c['announcement_date'], '%Y-%m-%d') >= cutoff_date:
-                    filtered.append(c)
-            except (KeyError, ValueError, TypeError):
-                continue
-        
-        # Filter by relevance
-        if params['min_relevance'] > 0:
-            filtered = [c for c in filtered 
-                       if isinstance(c.get('relevance_score'), (int, float)) and 
-                          c['relevance_score'] >= params['min_relevance']]
-        
-        # Filter by type
-        if params['commitment_type']:
-            filtered = [c for c in filtered 
-                       if c.get('commitment_type') == params['commitment_type']]
+        # A type filter starts from the indexed slice (dict lookup) rather
+        # than scanning every commitment
+        commitment_type = params['commitment_type']
+        if commitment_type:
+            commitments = dashboard_data.commitments_by_type(commitment_type)
+        else:
+            commitments = dashboard_data.load_latest_commitments()
+
+        # One pass: date window (preparsed '_ts' ordinal) and relevance,
+        # without the intermediate list per filter
+        cutoff_ord = (datetime.now().date() - timedelta(days=params['days_back'])).toordinal()
+        min_relevance = params['min_relevance']
+        filtered = [
+            c for c in commitments
+            if c.get('_ts', -1) >= cutoff_ord
+            and (min_relevance == 0 or c.get('relevance_score', -1.0) >= min_relevance)
+        ]
         
         return jsonify({
-            'commitments': filtered[:100],  # Limit response size
+            'commitments': _public(filtered[:100]),  # Limit response size
             'total': len(filtered),
             'filters_applied': {
                 'min_relevance': params['min_relevance'],
@@ -323,40 +463,30 @@ def api_funding():
     params = validate_query_params()
     
     try:
-        funding = dashboard_data.load_latest_funding()
-        
-        # Filter by date
-        cutoff_date = datetime.now() - timedelta(days=params['days_back'])
-        filtered = []
-        
-        for f in funding:
-            try:
-                if datetime.strptime(f['announcement_date'], '%Y-%m-%d') >= cutoff_date:
-                    filtered.append(f)
-            except (KeyError, ValueError, TypeError):
-                continue
-        
-        # Apply filters safely
-        if params['min_relevance'] > 0:
-            filtered = [f for f in filtered 
-                       if isinstance(f.get('dovu_relevance'), (int, float)) and 
-                          f['dovu_relevance'] >= params['min_relevance']]
-        
-        if params['sector']:
-            filtered = [f for f in filtered if f.get('sector') == params['sector']]
-        
-        if params['min_threat'] > 0:
-            filtered = [f for f in filtered 
-                       if isinstance(f.get('competitive_threat'), (int, float)) and 
-                          f['competitive_threat'] >= params['min_threat']]
-        
-        if params['min_partnership'] > 0:
-            filtered = [f for f in filtered 
-                       if isinstance(f.get('partnership_opportunity'), (int, float)) and 
-                          f['partnership_opportunity'] >= params['min_partnership']]
+        # A sector filter starts from the indexed slice (dict lookup)
+        # rather than scanning every funding event
+        sector = params['sector']
+        if sector:
+            funding = dashboard_data.funding_by_sector(sector)
+        else:
+            funding = dashboard_data.load_latest_funding()
+
+        # One pass over funding instead of a filter round per parameter,
+        # each of which reallocated the list
+        cutoff_ord = (datetime.now().date() - timedelta(days=params['days_back'])).toordinal()
+        min_relevance = params['min_relevance']
+        min_threat = params['min_threat']
+        min_partnership = params['min_partnership']
+        filtered = [
+            f for f in funding
+            if f.get('_ts', -1) >= cutoff_ord
+            and (min_relevance == 0 or f.get('dovu_relevance', -1.0) >= min_relevance)
+            and (min_threat == 0 or f.get('competitive_threat', -1.0) >= min_threat)
+            and (min_partnership == 0 or f.get('partnership_opportunity', -1.0) >= min_partnership)
+        ]
         
         return jsonify({
-            'funding_events': filtered[:100],  # Limit response size
+            'funding_events': _public(filtered[:100]),  # Limit response size
             'total': len(filtered),
             'filters_applied': {
                 'min_relevance': params['min_relevance'],
@@ -380,68 +510,56 @@ def api_alerts():
         
         alerts = []
         
-        # High-relevance commitments from last 7 days
-        week_ago = datetime.now() - timedelta(days=7)
-        
+        # High-relevance commitments from last 7 days; the preparsed '_ts'
+        # ordinal and isinstance guards replace strptime-with-try/except as
+        # control flow, which gets expensive as record counts grow
+        week_ago_ord = (datetime.now().date() - timedelta(days=7)).toordinal()
+
         for commitment in commitments:
-            try:
-                if (datetime.strptime(commitment['announcement_date'], '%Y-%m-%d') >= week_ago and
-                    isinstance(commitment.get('relevance_score'), (int, float)) and
-                    commitment['relevance_score'] > 0.6):
-                    
-                    alerts.append({
-                        'type': 'commitment',
-                        'priority': 'high',
-                        'title': f"🎯 High-Value Commitment: {commitment.get('company', 'Unknown')}",
-                        'description': f"{commitment.get('commitment_type', 'Unknown')} target, relevance score {commitment['relevance_score']:.2f}",
-                        'action': commitment.get('dovu_opportunity', 'Evaluate opportunity'),
-                        'date': commitment['announcement_date'],
-                        'source_url': commitment.get('source_url', '')
-                    })
-            except (KeyError, ValueError, TypeError):
-                continue
-        
-        # Competitive threats
-        for threat in funding:
-            try:
-                if (isinstance(threat.get('competitive_threat'), (int, float)) and 
-                    threat['competitive_threat'] > 0.6):
-                    
-                    alerts.append({
-                        'type': 'threat',
-                        'priority': 'urgent',
-                        'title': f"⚠️ Competitive Threat: {threat.get('company', 'Unknown')}",
-                        'description': f"{threat.get('funding_type', 'Funding')} {threat.get('amount', '')} - threat score {threat['competitive_threat']:.2f}",
-                        'action': "Monitor product development and market positioning",
-                        'date': threat.get('announcement_date', ''),
-                        'source_url': threat.get('source_url', '')
-                    })
-            except (KeyError, ValueError, TypeError):
-                continue
-        
-        # Partnership opportunities  
-        for opp in funding:
-            try:
-                if (isinstance(opp.get('partnership_opportunity'), (int, float)) and 
-                    opp['partnership_opportunity'] > 0.6):
-                    
-                    alerts.append({
-                        'type': 'partnership',
-                        'priority': 'medium',
-                        'title': f"🤝 Partnership Opportunity: {opp.get('company', 'Unknown')}",
-                        'description': f"{opp.get('business_model', 'Unknown model')} - partnership score {opp['partnership_opportunity']:.2f}",
-                        'action': "Evaluate integration and partnership potential",
-                        'date': opp.get('announcement_date', ''),
-                        'source_url': opp.get('source_url', '')
-                    })
-            except (KeyError, ValueError, TypeError):
-                continue
-        
-        # Sort by date (newest first)
-        alerts.sort(key=lambda x: x.get('date', ''), reverse=True)
+            score = commitment.get('relevance_score', -1.0)
+            if commitment.get('_ts', -1) >= week_ago_ord and score > 0.6:
+                alerts.append({
+                    'type': 'commitment',
+                    'priority': 'high',
+                    'title': f"🎯 High-Value Commitment: {commitment.get('company', 'Unknown')}",
+                    'description': f"{commitment.get('commitment_type', 'Unknown')} target, relevance score {score:.2f}",
+                    'action': commitment.get('dovu_opportunity', 'Evaluate opportunity'),
+                    'date': commitment.get('announcement_date', ''),
+                    'source_url': commitment.get('source_url', '')
+                })
+
+        # Competitive threats and partnership opportunities, in one pass
+        # over funding instead of two
+        for event in funding:
+            threat = event.get('competitive_threat', -1.0)
+            if threat > 0.6:
+                alerts.append({
+                    'type': 'threat',
+                    'priority': 'urgent',
+                    'title': f"⚠️ Competitive Threat: {event.get('company', 'Unknown')}",
+                    'description': f"{event.get('funding_type', 'Funding')} {event.get('amount', '')} - threat score {threat:.2f}",
+                    'action': "Monitor product development and market positioning",
+                    'date': event.get('announcement_date', ''),
+                    'source_url': event.get('source_url', '')
+                })
+            partnership = event.get('partnership_opportunity', -1.0)
+            if partnership > 0.6:
+                alerts.append({
+                    'type': 'partnership',
+                    'priority': 'medium',
+                    'title': f"🤝 Partnership Opportunity: {event.get('company', 'Unknown')}",
+                    'description': f"{event.get('business_model', 'Unknown model')} - partnership score {partnership:.2f}",
+                    'action': "Evaluate integration and partnership potential",
+                    'date': event.get('announcement_date', ''),
+                    'source_url': event.get('source_url', '')
+                })
         
+        # Top 20 by date (newest first); nlargest is O(N log 20) versus a
+        # full O(N log N) sort that we'd throw most of away
+        top_alerts = heapq.nlargest(20, alerts, key=lambda x: x.get('date', ''))
+
         return jsonify({
-            'alerts': alerts[:20],  # Limit to top 20
+            'alerts': top_alerts,
             'total': len(alerts)
         })
     except Exception:
@@ -493,6 +611,14 @@ if __name__ == '__main__':
     print(f"🔒 API Key Protection: {'Enabled' if os.environ.get('CARBON_DASHBOARD_API_KEY') else 'DISABLED'}")
     print(f"🌐 Port: {port}")
     print(f"🔧 Debug: {debug}")
-    
-    # Run with secure settings
-    app.run(debug=debug, host='0.0.0.0', port=port)
\ No newline at end of file
+
+    # Serve through a production WSGI server when available; Werkzeug's dev
+    # server handles one request at a time, so any slow parse blocks every
+    # client. Under gunicorn use: gunicorn -w 4 -k gthread --threads 8 secure_app:app
+    try:
+        from waitress import serve
+        print("🧵 Serving via waitress (8 threads)")
+        serve(app, host='0.0.0.0', port=port, threads=8)
+    except ImportError:
+        # Dev fallback: at least hand each request its own thread
+        app.run(debug=debug, host='0.0.0.0', port=port, threaded=True)
\ No newline at end of file
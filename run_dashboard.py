@@ -7,7 +7,6 @@ Orchestrates data collection and starts the web dashboard
 import sys
 import os
 import time
-import subprocess
 import threading
 from datetime import datetime
 
@@ -75,15 +74,18 @@ class DashboardOrchestrator:
     def start_dashboard(self):
         """Start the web dashboard"""
         print("🌐 Starting web dashboard on http://localhost:5000")
-        
-        # Change to dashboard directory
-        dashboard_dir = os.path.join(os.path.dirname(__file__), 'dashboard')
-        
+
+        # Import the Flask app and serve it from this interpreter; spawning
+        # a second python just to run app.py re-imports every dependency,
+        # doubles RSS and can't share caches with the collection thread
+        dashboard_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dashboard')
+        sys.path.insert(0, dashboard_dir)
+
         try:
-            # Start Flask app
-            subprocess.run([
-                sys.executable, 'app.py'
-            ], cwd=dashboard_dir)
+            from app import app
+            port = int(os.environ.get('PORT', 5000))
+            app.run(host='0.0.0.0', port=port, debug=False,
+                    use_reloader=False, threaded=True)
         except KeyboardInterrupt:
             print("\n🛑 Dashboard stopped by user")
         except Exception as e:
@@ -9,10 +9,12 @@ import subprocess
 import shutil
 
 def run_command(command, description):
-    """Run a command and handle errors"""
+    """Run a command (argument list) and handle errors"""
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        # List form skips the /bin/sh fork per step and can't be
+        # shell-injected through the paths
+        result = subprocess.run(command, check=True, capture_output=True, text=True)
         print(f"✅ {description} completed")
         return True
     except subprocess.CalledProcessError as e:
@@ -35,7 +37,12 @@ def setup_virtual_environment():
     
     if not os.path.exists(venv_dir):
         print("🔄 Creating virtual environment...")
-        if not run_command(f"{sys.executable} -m venv {venv_dir}", "Virtual environment creation"):
+        # uv creates venvs much faster than the stdlib when it's installed
+        if shutil.which("uv"):
+            created = run_command(["uv", "venv", venv_dir], "Virtual environment creation (uv)")
+        else:
+            created = run_command([sys.executable, "-m", "venv", venv_dir], "Virtual environment creation")
+        if not created:
             return False
     else:
         print("✅ Virtual environment already exists")
@@ -52,11 +59,14 @@ def setup_virtual_environment():
     
     return activate_script, pip_path, python_path
 
-def install_dependencies(pip_path):
+def install_dependencies(pip_path, python_path):
     """Install Python dependencies"""
-    if not run_command(f"{pip_path} install -r requirements.txt", "Installing dependencies"):
-        return False
-    return True
+    # uv resolves and downloads in parallel (Rust), typically an order of
+    # magnitude faster than pip; fall back to the venv's pip otherwise
+    if shutil.which("uv"):
+        return run_command(["uv", "pip", "install", "--python", python_path,
+                            "-r", "requirements.txt"], "Installing dependencies (uv)")
+    return run_command([pip_path, "install", "-r", "requirements.txt"], "Installing dependencies")
 
 def create_demo_data():
     """Create demo data for testing"""
@@ -84,7 +94,7 @@ def main():
         sys.exit(1)
     
     # Install dependencies
-    if not install_dependencies(pip_path):
+    if not install_dependencies(pip_path, python_path):
         sys.exit(1)
     
     # Create demo data
@@ -97,12 +107,11 @@ def main():
     print("   Press Ctrl+C to stop")
     print("-" * 50)
     
-    # Start the dashboard using the virtual environment Python
+    # Hand this process over to the dashboard: execv replaces the setup
+    # script outright, so no shell or extra interpreter stays resident
     try:
-        os.system(f"{python_path} run_dashboard.py")
-    except KeyboardInterrupt:
-        print("\n🛑 Dashboard stopped by user")
-    except Exception as e:
+        os.execv(python_path, [python_path, "run_dashboard.py"])
+    except OSError as e:
         print(f"❌ Error starting dashboard: {e}")
         
         # Fallback instructions